@@ -4,6 +4,7 @@
  */
 
 import { ToolHandler, ToolResult, toolSuccess, toolError } from '../base/tools'
+import { getSharedAnthropicClient } from '../base/api-call'
 
 // ============================================================================
 // Types
@@ -91,8 +92,7 @@ export const runContentAuditHandler: ToolHandler<RunContentAuditInput> = async (
     // Get Anthropic client if validating images
     let anthropicClient
     if (input.validate_image_content) {
-      const Anthropic = (await import('@anthropic-ai/sdk')).default
-      anthropicClient = new Anthropic()
+      anthropicClient = getSharedAnthropicClient()
     }
 
     const result = await runContentAudit({
@@ -325,8 +325,7 @@ export const validateImageHandler: ToolHandler<ValidateImageInput> = async (
     })
 
     const { validateImageContent } = await import('@swarm-press/shared')
-    const Anthropic = (await import('@anthropic-ai/sdk')).default
-    const client = new Anthropic()
+    const client = getSharedAnthropicClient()
 
     const result = await validateImageContent(
       {
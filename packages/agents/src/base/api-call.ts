@@ -26,6 +26,26 @@ export interface APICallOptions {
   stream?: boolean
 }
 
+// ============================================================================
+// Shared Client
+// ============================================================================
+
+let sharedClient: Anthropic | null = null
+
+/**
+ * Get a process-wide Anthropic client configured from the environment
+ * Tool handlers, collection getters and research tools all use this instead
+ * of constructing their own client, so keep-alive connections are reused
+ * rather than re-handshaking each time. Callers that need a shorter timeout
+ * pass it per request
+ */
+export function getSharedAnthropicClient(): Anthropic {
+  if (!sharedClient) {
+    sharedClient = new Anthropic()
+  }
+  return sharedClient
+}
+
 // ============================================================================
 // API Call Builder
 // ============================================================================
@@ -0,0 +1,50 @@
+/**
+ * File System Utilities
+ *
+ * Atomic file writes and memoized directory creation, shared by the getter
+ * caches and the batch scripts.
+ */
+
+import { mkdir, rename, rm, writeFile } from 'fs/promises'
+import { dirname } from 'path'
+
+/**
+ * Directories already created this process, keyed by path
+ */
+const createdDirs = new Map<string, Promise<void>>()
+
+/**
+ * Per-write counter so concurrent writes of the same file use distinct temp files
+ */
+let tmpFileCounter = 0
+
+/**
+ * Write via a temp file + rename so readers see either the old or the new
+ * contents, never a partial file. The temp file is removed if the write fails
+ */
+export async function writeFileAtomic(file: string, data: string | Buffer): Promise<void> {
+  const tmpFile = `${file}.${process.pid}.${++tmpFileCounter}.tmp`
+  try {
+    await writeFile(tmpFile, data)
+    await rename(tmpFile, file)
+  } catch (error) {
+    await rm(tmpFile, { force: true })
+    // The directory was removed under us (e.g. a cache clear); recreate it next time
+    if ((error as NodeJS.ErrnoException).code === 'ENOENT') createdDirs.delete(dirname(file))
+    throw error
+  }
+}
+
+/**
+ * Create a directory once per process; later writes skip the mkdir call
+ */
+export function ensureDir(dir: string): Promise<void> {
+  let created = createdDirs.get(dir)
+  if (!created) {
+    created = mkdir(dir, { recursive: true }).then(() => undefined)
+    // Forget failures so the next write retries
+    created.catch(() => createdDirs.delete(dir))
+    createdDirs.set(dir, created)
+  }
+  return created
+}
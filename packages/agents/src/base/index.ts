@@ -12,3 +12,7 @@ export * from './token-estimation'
 export * from './zod-tools'
 export * from './observability'
 export * from './editorial-config-loader'
+export * from './fs'
+export * from './retry'
+export * from './concurrency'
+export * from './json-extract'
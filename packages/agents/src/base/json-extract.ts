@@ -0,0 +1,194 @@
+/**
+ * JSON Extraction
+ * Locate JSON documents embedded in model text without regex backtracking
+ */
+
+/**
+ * Extract the complete JSON object or array starting at startPos
+ * Tracks strings and escapes so brackets inside string values don't count.
+ * Returns null if the document is not closed before the end of the text
+ */
+export function extractBalancedJson(text: string, startPos: number): string | null {
+  let depth = 0
+  let inString = false
+  let escape = false
+
+  for (let i = startPos; i < text.length; i++) {
+    const char = text[i]
+
+    if (inString) {
+      if (escape) {
+        escape = false
+      } else if (char === '\\') {
+        escape = true
+      } else if (char === '"') {
+        inString = false
+      }
+      continue
+    }
+
+    if (char === '"') {
+      inString = true
+    } else if (char === '{' || char === '[') {
+      depth++
+    } else if (char === '}' || char === ']') {
+      depth--
+      if (depth === 0) return text.substring(startPos, i + 1)
+    }
+  }
+
+  return null
+}
+
+/**
+ * Yield the text of each top-level JSON document, in order
+ * Looks inside code fences when there are any, otherwise at the whole text.
+ * Documents are never descended into: a balanced document that fails to
+ * parse is still yielded whole (for parseJsonDocument to repair), and an
+ * unclosed bracket yields the rest of the block and ends the scan of that
+ * block, since everything after it belongs to the truncated document
+ */
+export function* iterateJsonDocuments(text: string): Generator<string> {
+  const blocks = getFencedBlocks(text)
+
+  for (const block of blocks.length > 0 ? blocks : [text]) {
+    let pos = nextOpening(block, 0)
+    while (pos !== -1) {
+      const json = extractBalancedJson(block, pos)
+      if (json === null) {
+        yield block.substring(pos)
+        break
+      }
+      yield json
+      pos = nextOpening(block, pos + json.length)
+    }
+  }
+}
+
+/**
+ * Parse a document from iterateJsonDocuments, falling back to repairJson
+ * for trailing commas and truncation. Returns null if neither parses
+ */
+export function parseJsonDocument(json: string): { value: unknown; repaired: boolean } | null {
+  try {
+    return { value: JSON.parse(json), repaired: false }
+  } catch {
+    // Try to repair below
+  }
+
+  const repaired = repairJson(json)
+  if (repaired) {
+    try {
+      return { value: JSON.parse(repaired), repaired: true }
+    } catch {
+      // Not repairable
+    }
+  }
+  return null
+}
+
+/**
+ * Parse (or repair) each top-level JSON document in the text, in order
+ */
+export function* iterateJsonValues(text: string): Generator<unknown> {
+  for (const json of iterateJsonDocuments(text)) {
+    const parsed = parseJsonDocument(json)
+    if (parsed) yield parsed.value
+  }
+}
+
+/**
+ * Best-effort repair of the first JSON document in the text
+ * Drops trailing commas and, when the output was truncated (e.g. at
+ * max_tokens), cuts back to the last completed value and closes the open
+ * brackets so the items generated so far can still be used.
+ * Returns null if there is nothing salvageable
+ */
+export function repairJson(text: string): string | null {
+  const start = nextOpening(text, 0)
+  if (start === -1) return null
+
+  let out = ''
+  const closers: string[] = []
+  let inString = false
+  let escape = false
+  let pendingComma = -1
+  let safeLength = 0
+  let safeClosers: string[] = []
+
+  for (let i = start; i < text.length; i++) {
+    const char = text[i] as string
+
+    if (inString) {
+      out += char
+      if (escape) {
+        escape = false
+      } else if (char === '\\') {
+        escape = true
+      } else if (char === '"') {
+        inString = false
+      }
+      continue
+    }
+
+    if (char === '}' || char === ']') {
+      // Drop a trailing comma before the closing bracket
+      if (pendingComma !== -1) out = out.substring(0, pendingComma)
+      pendingComma = -1
+      if (closers.length === 0) break
+
+      out += closers.pop()
+      if (closers.length === 0) return out
+      safeLength = out.length
+      safeClosers = [...closers]
+      continue
+    }
+
+    if (char === ',') {
+      pendingComma = out.length
+    } else if (!/\s/.test(char)) {
+      pendingComma = -1
+    }
+
+    if (char === '"') {
+      inString = true
+    } else if (char === '{') {
+      closers.push('}')
+    } else if (char === '[') {
+      closers.push(']')
+    }
+    out += char
+  }
+
+  if (safeLength === 0) return null
+  return out.substring(0, safeLength) + safeClosers.reverse().join('')
+}
+
+/**
+ * Contents of each ``` code fence, without the language tag
+ * An unclosed fence (truncated output) runs to the end of the text
+ */
+function getFencedBlocks(text: string): string[] {
+  const blocks: string[] = []
+  let open = text.indexOf('```')
+
+  while (open !== -1) {
+    let start = open + 3
+    while (start < text.length && /[A-Za-z]/.test(text[start] as string)) start++
+
+    const close = text.indexOf('```', start)
+    blocks.push(text.substring(start, close === -1 ? text.length : close))
+    if (close === -1) break
+    open = text.indexOf('```', close + 3)
+  }
+
+  return blocks
+}
+
+function nextOpening(text: string, from: number): number {
+  for (let i = from; i < text.length; i++) {
+    const char = text[i]
+    if (char === '{' || char === '[') return i
+  }
+  return -1
+}
@@ -0,0 +1,100 @@
+/**
+ * Retry
+ * Exponential backoff with jitter for transient Claude API failures
+ */
+
+import Anthropic from '@anthropic-ai/sdk'
+
+export interface RetryOptions {
+  maxAttempts?: number
+  initialDelayMs?: number
+  maxDelayMs?: number
+  label?: string
+}
+
+interface ApiErrorBody {
+  type?: string
+  error?: { type?: string }
+}
+
+/**
+ * Error types the API reports for transient conditions
+ */
+const RETRYABLE_ERROR_TYPES = new Set(['rate_limit_error', 'overloaded_error', 'api_error'])
+
+/**
+ * Whether an API error is worth retrying: rate limits (429), overload (529),
+ * server errors, connection failures and timeouts. Client errors like
+ * 400/401 fail immediately
+ */
+export function isRetryableError(error: unknown): boolean {
+  // Also covers APIConnectionTimeoutError, which extends it
+  if (error instanceof Anthropic.APIConnectionError) return true
+
+  const err = error as { status?: number; error?: ApiErrorBody } | null
+  if (!err) return false
+
+  if (err.status === 429 || err.status === 529 || (err.status !== undefined && err.status >= 500)) {
+    return true
+  }
+
+  // Errors sent mid-stream as SSE events carry no status, only the body:
+  // { type: 'error', error: { type: 'overloaded_error', ... } }
+  const errorType = err.error?.error?.type ?? err.error?.type
+  return errorType !== undefined && RETRYABLE_ERROR_TYPES.has(errorType)
+}
+
+/**
+ * Server-requested delay from retry-after-ms / retry-after headers, if any
+ */
+function getRetryAfterMs(error: unknown): number | undefined {
+  const headers = (error as { headers?: unknown } | null)?.headers
+  if (!headers || typeof headers !== 'object') return undefined
+
+  // Fetch-style Headers or a plain record, depending on SDK version
+  const fetchHeaders = headers as { get?: (name: string) => string | null }
+  const get = (name: string): string | null | undefined =>
+    typeof fetchHeaders.get === 'function'
+      ? fetchHeaders.get(name)
+      : (headers as Record<string, string | null | undefined>)[name]
+
+  const retryAfterMs = Number(get('retry-after-ms'))
+  if (retryAfterMs > 0) return retryAfterMs
+
+  const retryAfter = get('retry-after')
+  if (!retryAfter) return undefined
+  const seconds = Number(retryAfter)
+  if (seconds > 0) return seconds * 1000
+  // HTTP-date form
+  const date = Date.parse(retryAfter)
+  return Number.isNaN(date) ? undefined : Math.max(date - Date.now(), 0)
+}
+
+/**
+ * Run fn, retrying retryable errors with exponential backoff + 0-30% jitter,
+ * waiting at least as long as the response's retry-after header asks
+ */
+export async function withRetry<T>(
+  fn: () => Promise<T>,
+  options: RetryOptions = {}
+): Promise<T> {
+  const { maxAttempts = 4, initialDelayMs = 1000, maxDelayMs = 30000, label = 'request' } = options
+
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fn()
+    } catch (error) {
+      if (!isRetryableError(error) || attempt >= maxAttempts) {
+        throw error
+      }
+
+      const baseDelay = Math.min(initialDelayMs * Math.pow(2, attempt - 1), maxDelayMs)
+      // Never retry sooner than the server asked us to
+      const delay = Math.max(baseDelay + Math.random() * 0.3 * baseDelay, getRetryAfterMs(error) ?? 0)
+
+      const errorMessage = error instanceof Error ? error.message : 'Unknown error'
+      console.warn(`[Retry] ${label} failed (${errorMessage}), retrying in ${Math.round(delay / 1000)}s (${attempt}/${maxAttempts - 1})`)
+      await new Promise(resolve => setTimeout(resolve, delay))
+    }
+  }
+}
@@ -5,19 +5,139 @@
 
 import Anthropic from '@anthropic-ai/sdk'
 import { db } from '@swarm-press/backend'
-import { getEnv } from '@swarm-press/shared'
-import { transformToStructuredOutputSchema, wrapSchemaForArrayOutput } from './schema-transformer'
-import { buildCollectionPrompt } from './prompt-builder'
+import { extractStringValue } from '@swarm-press/shared'
+import {
+  transformToStructuredOutputSchema,
+  omitSchemaProperties,
+  pickSchemaProperties,
+  wrapSchemaForArrayOutput
+} from './schema-transformer'
+import { extractCoreSchema } from '../tools/research/schema-transformer'
+import {
+  buildCollectionPrompt,
+  buildCollectionSystemPrompt,
+  buildItemDetailPrompt,
+  EMIT_ITEMS_TOOL_NAME
+} from './prompt-builder'
+import { getSharedAnthropicClient } from '../base/api-call'
+import { mapWithConcurrency } from '../base/concurrency'
+import { iterateJsonDocuments, parseJsonDocument } from '../base/json-extract'
+import { getItemValidator, validateItems, type ItemValidationError } from './item-validator'
+import { isRetryableError, withRetry } from '../base/retry'
+import { getAdaptiveMaxTokens, recordOutputTokens } from './token-stats'
+import {
+  isResponseCacheEnabled,
+  getResponseCacheKey,
+  readCachedResponse,
+  writeCachedResponse
+} from './response-cache'
 import type {
+  CollectionBatchOptions,
   CollectionGetterOptions,
   CollectionGetterResult,
   WebsiteCollectionInfo,
   ResearchConfigInfo
 } from './types'
 
+/**
+ * Fields computed after extraction instead of asking the model for them
+ */
+const DERIVED_FIELDS = ['rank', 'last_updated', 'generated_at'] as const
+
+/**
+ * Timestamp fields set to the extraction time
+ */
+const TIMESTAMP_FIELDS = ['last_updated', 'generated_at'] as const
+
+/**
+ * max_tokens ceiling per kind of call; the actual value comes from recent
+ * output-token stats so the API doesn't reserve capacity for worst-case output
+ */
+const MAX_TOKENS = {
+  items: 16384,
+  listing: 2048,
+  detail: 4096
+} as const
+
+type RequestKind = keyof typeof MAX_TOKENS
+
+/**
+ * Smaller model used when the primary model keeps failing with retryable errors
+ */
+const FALLBACK_MODEL = 'claude-3-5-haiku-20241022'
+const FALLBACK_MAX_TOKENS = 8192
+
+/**
+ * Per-request timeout; streamed requests only need to start within this window
+ * Passed per call because the shared client is also used by other agents
+ */
+const REQUEST_TIMEOUT_MS = 120_000
+
+/**
+ * Per-block response diagnostics, only logged with LOG_LEVEL=debug
+ */
+const DEBUG = process.env.LOG_LEVEL === 'debug'
+const debugLog: (...args: unknown[]) => void = DEBUG ? console.log : () => {}
+
+/**
+ * Usage block including prompt caching counters
+ */
+type PromptCacheUsage = Anthropic.Usage & {
+  cache_read_input_tokens?: number | null
+  cache_creation_input_tokens?: number | null
+}
+
+interface ItemsResponse<T> {
+  items: T[]
+  usage: PromptCacheUsage
+}
+
+type StaticRequestParts = Pick<Anthropic.MessageCreateParamsNonStreaming, 'tools' | 'system'>
+
+/**
+ * Server-side web search tool, identical for every call
+ */
+const WEB_SEARCH_TOOL = {
+  type: 'web_search_20250305',
+  name: 'web_search',
+  max_uses: 5
+} as any
+
+/**
+ * Tools + system blocks keyed by the item schema object they were built for
+ */
+const staticRequestParts = new WeakMap<Record<string, unknown>, StaticRequestParts>()
+
+/**
+ * Per-call response cache controls, taken from the getter options
+ */
+type ResponseCacheOptions = Pick<CollectionGetterOptions, 'forceRefresh' | 'cacheTtlMs'>
+
+/**
+ * Getter options used by one items call: cache controls plus the item count,
+ * which the token stats are keyed by
+ */
+type ItemsRequestOptions = ResponseCacheOptions & Pick<CollectionGetterOptions, 'count'>
+
+/**
+ * A created message, plus the response cache key when it is a fresh
+ * response that may be cached once its items have been extracted
+ */
+interface CreatedMessage {
+  response: Anthropic.Message
+  cacheKey: string | null
+}
+
+interface PreparedCollectionRequest {
+  collection: WebsiteCollectionInfo
+  itemSchema: Record<string, unknown>
+  prompt: string
+}
+
 /**
  * Get collection items with ONE Claude API call
- * Uses web search + structured outputs for guaranteed schema compliance
+ * Uses web search + an emit_items tool call for schema-shaped output
+ * With detailConcurrency set, lists names first and fetches details in parallel
  */
 export async function getCollectionItems<T = Record<string, unknown>>(
   options: CollectionGetterOptions
@@ -25,56 +145,42 @@ export async function getCollectionItems<T = Record<string, unknown>>(
   const { websiteId, collectionType } = options
 
   try {
-    // 1. Load collection info from database
-    const collection = await getCollectionInfo(websiteId, collectionType)
-    if (!collection) {
+    // 1-4. Load collection + research config, build schema and prompt
+    const prepared = await prepareCollectionRequest(options)
+    if (!prepared) {
       return {
         success: false,
         items: [],
         error: `Collection '${collectionType}' not found for website ${websiteId}`
       }
     }
+    const { collection, itemSchema, prompt } = prepared
 
-    // 2. Load research config (optional)
-    const researchConfig = await getResearchConfig(collection.id)
-
-    // 3. Build the prompt
-    const prompt = buildCollectionPrompt(collection, researchConfig, options)
-
-    // 4. Transform schema for structured outputs
-    const itemSchema = transformToStructuredOutputSchema(collection.json_schema)
-    const outputSchema = wrapSchemaForArrayOutput(itemSchema)
-
-    // 5. Initialize client
-    const client = new Anthropic({ apiKey: getEnv().ANTHROPIC_API_KEY })
+    // 5. Get the shared client
+    const client = getSharedAnthropicClient()
 
     console.log(`[Getter] Fetching ${options.count || 20} items for ${collectionType}`)
 
-    // 6. Make ONE API call with web search + structured outputs
-    const response = await client.messages.create({
-      model: 'claude-sonnet-4-20250514',
-      max_tokens: 16384,
-      // Note: web_search and structured outputs may not be combinable
-      // If SO doesn't work with web_search, we'll fall back to regular JSON parsing
-      tools: [{
-        type: 'web_search_20250305',
-        name: 'web_search',
-        max_uses: 5
-      } as any],
-      messages: [{ role: 'user', content: prompt }]
-    })
-
-    console.log(`[Getter] Response: stop_reason=${response.stop_reason}, tokens: ${response.usage.input_tokens}/${response.usage.output_tokens}`)
+    // 6. Make ONE API call, or a listing call plus parallel detail calls
+    const responses = options.detailConcurrency
+      ? await requestItemsInParallel<T>(client, collection, itemSchema, prompt, options)
+      : [await requestItems<T>(client, collection, itemSchema, prompt, 'items', options)]
 
-    // 7. Extract items from response
-    const items = extractItemsFromResponse<T>(response)
+    // 7-8. Merge items from all responses and keep only schema-valid ones
+    const { items, validationErrors } = finalizeItems(
+      responses.flatMap(response => response.items),
+      collection
+    )
 
     return {
       success: true,
       items,
+      validationErrors,
       usage: {
-        inputTokens: response.usage.input_tokens,
-        outputTokens: response.usage.output_tokens
+        inputTokens: sumUsage(responses, 'input_tokens'),
+        outputTokens: sumUsage(responses, 'output_tokens'),
+        cacheReadInputTokens: sumUsage(responses, 'cache_read_input_tokens'),
+        cacheCreationInputTokens: sumUsage(responses, 'cache_creation_input_tokens')
       }
     }
 
@@ -89,15 +195,544 @@ export async function getCollectionItems<T = Record<string, unknown>>(
   }
 }
 
+/**
+ * Get items for many collection requests with ONE Message Batches submission
+ * Batched requests are billed at half price but complete asynchronously, so
+ * this polls until the batch has ended. Results keep the order of optionsList
+ */
+export async function getCollectionItemsBatch<T = Record<string, unknown>>(
+  optionsList: CollectionGetterOptions[],
+  batchOptions: CollectionBatchOptions = {}
+): Promise<CollectionGetterResult<T>[]> {
+  const { pollIntervalMs = 30_000, maxWaitMs = 24 * 60 * 60 * 1000 } = batchOptions
+  const results: CollectionGetterResult<T>[] = optionsList.map(options => ({
+    success: false,
+    items: [],
+    error: `Collection '${options.collectionType}' not found for website ${options.websiteId}`
+  }))
+
+  try {
+    // 1. Prepare every request; missing collections keep their error result
+    const prepared = await Promise.all(optionsList.map(prepareCollectionRequest))
+    const requests: Array<{ custom_id: string; params: any }> = []
+    for (const [index, request] of prepared.entries()) {
+      if (!request) continue
+      // Replaced below when the batch returns an entry for this request
+      results[index] = { success: false, items: [], error: 'No result returned from batch' }
+      requests.push({
+        // custom_id only allows [a-zA-Z0-9_-], so map results back by index
+        custom_id: `${request.collection.collection_type}-${index}`,
+        // Batch results can't be retried at a higher limit like real-time
+        // calls, so they always get the ceiling rather than the adaptive limit
+        params: buildItemsRequestParams(
+          request.collection,
+          request.itemSchema,
+          request.prompt,
+          MAX_TOKENS.items
+        ) as any
+      })
+    }
+    if (requests.length === 0) return results
+
+    // 2. Submit all requests in one call
+    const client = getSharedAnthropicClient()
+    const batch = await client.beta.messages.batches.create({ requests })
+    console.log(`[Getter] Submitted batch ${batch.id} with ${requests.length} requests`)
+
+    // 3. Poll until the batch has ended
+    const startTime = Date.now()
+    let status = batch.processing_status
+    while (status !== 'ended') {
+      if (Date.now() - startTime > maxWaitMs) {
+        throw new Error(`Batch ${batch.id} timed out after ${maxWaitMs / 1000 / 60} minutes`)
+      }
+      await new Promise(resolve => setTimeout(resolve, pollIntervalMs))
+      const current = await client.beta.messages.batches.retrieve(batch.id)
+      status = current.processing_status
+      console.log(`[Getter] Batch ${batch.id}: ${current.request_counts.succeeded}/${requests.length} succeeded`)
+    }
+
+    // 4. Parse each result with the same extractor as single requests
+    for await (const entry of await client.beta.messages.batches.results(batch.id)) {
+      const index = Number(entry.custom_id.substring(entry.custom_id.lastIndexOf('-') + 1))
+      const request = prepared[index]
+      if (!request) continue
+
+      if (entry.result.type !== 'succeeded') {
+        results[index] = {
+          success: false,
+          items: [],
+          error: entry.result.type === 'errored'
+            ? entry.result.error.error.message
+            : `Batch request ${entry.result.type}`
+        }
+        continue
+      }
+
+      const message = entry.result.message as unknown as Anthropic.Message
+      const usage = message.usage as PromptCacheUsage
+      if (message.stop_reason === 'max_tokens') {
+        console.warn(`[Getter] Batch result for ${request.collection.collection_type} truncated at ${MAX_TOKENS.items} tokens; item list may be incomplete`)
+      } else {
+        recordTokenStats(getTokenStatsKey(request.collection, 'items', optionsList[index]?.count), usage.output_tokens)
+      }
+      const { items, validationErrors } = finalizeItems(
+        extractItemsFromResponse<T>(message),
+        request.collection
+      )
+      results[index] = {
+        success: true,
+        items,
+        validationErrors,
+        usage: {
+          inputTokens: usage.input_tokens,
+          outputTokens: usage.output_tokens,
+          cacheReadInputTokens: usage.cache_read_input_tokens ?? 0,
+          cacheCreationInputTokens: usage.cache_creation_input_tokens ?? 0
+        }
+      }
+    }
+
+    return results
+
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : 'Unknown error'
+    console.error('[Getter] Error fetching batch:', errorMessage)
+    return optionsList.map(() => ({
+      success: false,
+      items: [],
+      error: errorMessage
+    }))
+  }
+}
+
+/**
+ * Build the request getCollectionItems would send, without calling the API
+ * Also compiles the collection's item validator, so schema problems surface
+ * in a dry run rather than after paying for a response
+ */
+export async function buildCollectionRequest(
+  options: CollectionGetterOptions
+): Promise<Anthropic.MessageCreateParamsNonStreaming | null> {
+  const prepared = await prepareCollectionRequest(options)
+  if (!prepared) return null
+
+  const { collection, itemSchema, prompt } = prepared
+  getItemValidator(collection.id, collection.json_schema)
+
+  const maxTokens = await getAdaptiveMaxTokens(
+    getTokenStatsKey(collection, 'items', options.count),
+    MAX_TOKENS.items
+  )
+  return buildItemsRequestParams(collection, itemSchema, prompt, maxTokens)
+}
+
+/**
+ * Load the collection and research config, then build the item schema and prompt
+ * Returns null when the collection does not exist or is disabled
+ */
+async function prepareCollectionRequest(
+  options: CollectionGetterOptions
+): Promise<PreparedCollectionRequest | null> {
+  const collection = await getCollectionInfo(options.websiteId, options.collectionType)
+  if (!collection) return null
+
+  const researchConfig = await getResearchConfig(collection.id)
+
+  // Seeded schemas are { $ref: '#/definitions/<type>', definitions }; the
+  // transform drops the root $ref, so resolve it to the item schema first
+  return {
+    collection,
+    itemSchema: omitSchemaProperties(
+      transformToStructuredOutputSchema(extractCoreSchema(collection.json_schema)),
+      DERIVED_FIELDS
+    ),
+    prompt: buildCollectionPrompt(collection, researchConfig, options)
+  }
+}
+
+/**
+ * Fill in derived fields, then keep only items that match the collection schema
+ */
+function finalizeItems<T>(
+  extracted: T[],
+  collection: WebsiteCollectionInfo
+): { items: T[]; validationErrors: ItemValidationError[] } {
+  applyDerivedFields(extracted, collection.json_schema)
+
+  const { valid: items, errors: validationErrors } = validateItems(
+    extracted,
+    getItemValidator(collection.id, collection.json_schema)
+  )
+  if (validationErrors.length > 0) {
+    console.warn(`[Getter] ${extracted.length - items.length} of ${extracted.length} items failed schema validation`)
+    // Ranks were assigned before invalid items were dropped; close the gaps
+    renumberRanks(items)
+  }
+  return { items, validationErrors }
+}
+
+/**
+ * Make one API call with web search + an emit_items tool for the result
+ * The static collection instructions are sent as a prompt-cached system block
+ */
+async function requestItems<T>(
+  client: Anthropic,
+  collection: WebsiteCollectionInfo,
+  itemSchema: Record<string, unknown>,
+  prompt: string,
+  kind: RequestKind,
+  options: ItemsRequestOptions = {}
+): Promise<ItemsResponse<T>> {
+  const statsKey = getTokenStatsKey(collection, kind, options.count)
+  const maxTokens = await getAdaptiveMaxTokens(statsKey, MAX_TOKENS[kind])
+
+  let created = await createMessage(
+    client,
+    collection.collection_type,
+    buildItemsRequestParams(collection, itemSchema, prompt, maxTokens),
+    statsKey,
+    options
+  )
+  let usage = created.response.usage as PromptCacheUsage
+
+  // A limit sized from past output can cut off an unusually long answer;
+  // retry once at the ceiling rather than keep a partial item list
+  if (created.response.stop_reason === 'max_tokens' && maxTokens < MAX_TOKENS[kind]) {
+    console.warn(`[Getter] Truncated at ${maxTokens} tokens, retrying with ${MAX_TOKENS[kind]}`)
+    created = await createMessage(
+      client,
+      collection.collection_type,
+      buildItemsRequestParams(collection, itemSchema, prompt, MAX_TOKENS[kind]),
+      statsKey,
+      options
+    )
+    usage = addUsage(usage, created.response.usage as PromptCacheUsage)
+  }
+
+  const { response, cacheKey } = created
+
+  console.log(`[Getter] Response: stop_reason=${response.stop_reason}, tokens: ${usage.input_tokens}/${usage.output_tokens}, cache read/write: ${usage.cache_read_input_tokens ?? 0}/${usage.cache_creation_input_tokens ?? 0}`)
+
+  const items = extractItemsFromResponse<T>(response)
+  // Only cache responses that produced items, so a pause_turn or a prose
+  // answer without items is requested again instead of served for a day
+  if (cacheKey && items.length > 0) {
+    cacheResponse(collection.collection_type, cacheKey, response)
+  }
+
+  return { items, usage }
+}
+
+/**
+ * Build the request parameters for one items call
+ * Shared by real-time requests and Message Batches submissions
+ */
+function buildItemsRequestParams(
+  collection: WebsiteCollectionInfo,
+  itemSchema: Record<string, unknown>,
+  prompt: string,
+  maxTokens: number
+): Anthropic.MessageCreateParamsNonStreaming {
+  return {
+    model: 'claude-sonnet-4-20250514',
+    max_tokens: maxTokens,
+    ...getStaticRequestParts(collection, itemSchema),
+    messages: [{ role: 'user', content: prompt }]
+  }
+}
+
+/**
+ * Get the tools and system blocks for an item schema, built once per schema
+ * Detail calls reuse the same itemSchema object, so N parallel calls share
+ * one wrapped input_schema and system prompt instead of rebuilding them
+ */
+function getStaticRequestParts(
+  collection: WebsiteCollectionInfo,
+  itemSchema: Record<string, unknown>
+): StaticRequestParts {
+  const cached = staticRequestParts.get(itemSchema)
+  if (cached) return cached
+
+  const parts: StaticRequestParts = {
+    // tool_choice stays on auto so the model can search before emitting;
+    // if it answers in text instead, we fall back to regular JSON parsing
+    tools: [WEB_SEARCH_TOOL, {
+      name: EMIT_ITEMS_TOOL_NAME,
+      description: `Deliver the final ${collection.display_name} items once research is complete`,
+      input_schema: wrapSchemaForArrayOutput(itemSchema) as Anthropic.Tool.InputSchema
+    }],
+    system: [{
+      type: 'text',
+      text: buildCollectionSystemPrompt(collection),
+      cache_control: { type: 'ephemeral' }
+    } as Anthropic.TextBlockParam]
+  }
+  staticRequestParts.set(itemSchema, parts)
+  return parts
+}
+
+/**
+ * List item names with one cheap call, then fetch full details per item in parallel
+ * Detail calls share the cached system prompt and decode concurrently, so wall
+ * time is roughly the listing call plus the slowest detail call
+ */
+async function requestItemsInParallel<T>(
+  client: Anthropic,
+  collection: WebsiteCollectionInfo,
+  itemSchema: Record<string, unknown>,
+  prompt: string,
+  options: CollectionGetterOptions
+): Promise<ItemsResponse<T>[]> {
+  // title_field may be a dotted path (basic_information.name), so the listing
+  // schema keeps its top-level property and names are read by path
+  const titleField = collection.title_field
+  const listing = await requestItems<Record<string, unknown>>(
+    client,
+    collection,
+    pickSchemaProperties(itemSchema, [titleField.split('.')[0] ?? titleField]),
+    prompt,
+    'listing',
+    options
+  )
+
+  const names = listing.items
+    .map(item => extractStringValue(item, titleField))
+    .filter((name): name is string => typeof name === 'string' && name.length > 0)
+
+  // Without names there is nothing to fetch details for; make the single
+  // full call instead of reporting success with no items
+  if (names.length === 0) {
+    console.warn(`[Getter] Listing returned no ${titleField} values, falling back to one full call`)
+    return [
+      { items: [], usage: listing.usage },
+      await requestItems<T>(client, collection, itemSchema, prompt, 'items', options)
+    ]
+  }
+
+  console.log(`[Getter] Fetching details for ${names.length} items, ${options.detailConcurrency} at a time`)
+
+  const details = await mapWithConcurrency(names, options.detailConcurrency || 1, async (name) => {
+    try {
+      return await requestItems<T>(
+        client,
+        collection,
+        itemSchema,
+        buildItemDetailPrompt(collection, name, options),
+        'detail',
+        options
+      )
+    } catch (error) {
+      const errorMessage = error instanceof Error ? error.message : 'Unknown error'
+      console.warn(`[Getter] Failed to fetch details for "${name}":`, errorMessage)
+      return null
+    }
+  })
+
+  return [
+    { items: [], usage: listing.usage },
+    ...details.filter((detail): detail is ItemsResponse<T> => detail !== null)
+  ]
+}
+
+/**
+ * Combine the usage of two calls made for one request
+ */
+function addUsage(a: PromptCacheUsage, b: PromptCacheUsage): PromptCacheUsage {
+  return {
+    ...b,
+    input_tokens: a.input_tokens + b.input_tokens,
+    output_tokens: a.output_tokens + b.output_tokens,
+    cache_read_input_tokens: (a.cache_read_input_tokens ?? 0) + (b.cache_read_input_tokens ?? 0),
+    cache_creation_input_tokens: (a.cache_creation_input_tokens ?? 0) + (b.cache_creation_input_tokens ?? 0)
+  }
+}
+
+/**
+ * Sum a usage counter across responses
+ */
+function sumUsage(
+  responses: ItemsResponse<unknown>[],
+  field: 'input_tokens' | 'output_tokens' | 'cache_read_input_tokens' | 'cache_creation_input_tokens'
+): number {
+  return responses.reduce((total, response) => total + (response.usage[field] ?? 0), 0)
+}
+
+/**
+ * Fill in derived fields the collection schema declares
+ * Items arrive ordered most to least recommended, so rank is their position;
+ * timestamps are set here rather than left for the model to invent
+ */
+function applyDerivedFields(items: unknown[], schema: Record<string, unknown>): void {
+  // Look at the item schema itself, not a { $ref, definitions } wrapper
+  const properties = (extractCoreSchema(schema).properties || {}) as Record<string, unknown>
+  const hasRank = 'rank' in properties
+  const timestampFields = TIMESTAMP_FIELDS.filter(field => field in properties)
+  if (!hasRank && timestampFields.length === 0) return
+
+  const now = new Date().toISOString()
+  items.forEach((item, index) => {
+    if (item && typeof item === 'object') {
+      const record = item as Record<string, unknown>
+      if (hasRank) record.rank = index + 1
+      for (const field of timestampFields) record[field] = now
+    }
+  })
+}
+
+/**
+ * Reassign rank by position to items that carry one
+ */
+function renumberRanks(items: unknown[]): void {
+  items.forEach((item, index) => {
+    const record = item as Record<string, unknown>
+    if ('rank' in record) record.rank = index + 1
+  })
+}
+
+/**
+ * Token stats are tracked per collection and kind of call
+ * Items and listing output grows with the requested count, so those are
+ * also keyed by it; a count=20 call must not be sized from count=5 runs
+ */
+function getTokenStatsKey(collection: WebsiteCollectionInfo, kind: RequestKind, count?: number): string {
+  if (kind === 'detail') return `${collection.collection_type}:${kind}`
+  return `${collection.collection_type}:${kind}:${count || 20}`
+}
+
+/**
+ * Record output tokens without blocking the caller
+ */
+function recordTokenStats(statsKey: string, outputTokens: number): void {
+  recordOutputTokens(statsKey, outputTokens).catch((error) => {
+    console.warn(`[Getter] Failed to write token stats:`, error instanceof Error ? error.message : error)
+  })
+}
+
+/**
+ * Create a message, serving repeat requests from the on-disk response cache
+ * Returns the cache key for fresh responses that may be cached; the caller
+ * writes the entry once extraction has produced items. Truncated responses
+ * are never cached so a retry can get the full output.
+ * With forceRefresh the cached entry is skipped but still replaced; cacheTtlMs
+ * overrides how old an entry may be before it counts as a miss
+ */
+async function createMessage(
+  client: Anthropic,
+  collectionType: string,
+  params: Anthropic.MessageCreateParamsNonStreaming,
+  statsKey: string,
+  { forceRefresh = false, cacheTtlMs }: ResponseCacheOptions = {}
+): Promise<CreatedMessage> {
+  if (!isResponseCacheEnabled()) {
+    const response = await requestMessage(client, collectionType, params)
+    // Fallback-model output says nothing about what the primary model needs
+    if (response.stop_reason !== 'max_tokens' && response.model === params.model) {
+      recordTokenStats(statsKey, response.usage.output_tokens)
+    }
+    return { response, cacheKey: null }
+  }
+
+  // max_tokens is left out of the key: it follows token stats and changes between runs
+  const cacheKey = getResponseCacheKey({ ...params, max_tokens: undefined })
+  const cached = forceRefresh ? null : await readCachedResponse(collectionType, cacheKey, cacheTtlMs)
+  if (cached) {
+    console.log(`[Getter] Cache hit for ${collectionType} (${cacheKey.substring(0, 12)})`)
+    return { response: cached, cacheKey: null }
+  }
+
+  const response = await requestMessage(client, collectionType, params)
+  // Fallback-model responses are not cached so the next run retries the primary model
+  if (response.stop_reason !== 'max_tokens' && response.model === params.model) {
+    recordTokenStats(statsKey, response.usage.output_tokens)
+    return { response, cacheKey }
+  }
+  return { response, cacheKey: null }
+}
+
+/**
+ * Write a response to the cache without blocking the caller
+ * Not awaited: the write overlaps with validation
+ */
+function cacheResponse(collectionType: string, cacheKey: string, response: Anthropic.Message): void {
+  writeCachedResponse(collectionType, cacheKey, response).catch((error) => {
+    console.warn(`[Getter] Failed to write response cache:`, error instanceof Error ? error.message : error)
+  })
+}
+
+/**
+ * Stream a message, retrying transient failures with backoff
+ * If the primary model keeps failing (e.g. overloaded), fall back to a
+ * smaller model once rather than losing the whole run
+ */
+async function requestMessage(
+  client: Anthropic,
+  collectionType: string,
+  params: Anthropic.MessageCreateParamsNonStreaming
+): Promise<Anthropic.Message> {
+  try {
+    return await withRetry(() => streamMessage(client, params), { label: collectionType })
+  } catch (error) {
+    if (!isRetryableError(error) || params.model === FALLBACK_MODEL) throw error
+
+    console.warn(`[Getter] ${params.model} unavailable for ${collectionType}, falling back to ${FALLBACK_MODEL}`)
+    return withRetry(
+      () => streamMessage(client, {
+        ...params,
+        model: FALLBACK_MODEL,
+        max_tokens: Math.min(params.max_tokens, FALLBACK_MAX_TOKENS)
+      }),
+      { label: `${collectionType} (fallback)` }
+    )
+  }
+}
+
+/**
+ * Stream a message and resolve with the final accumulated message
+ * Streaming avoids long idle HTTP waits on large generations and lets us
+ * report progress as each content block completes
+ */
+async function streamMessage(
+  client: Anthropic,
+  params: Anthropic.MessageCreateParamsNonStreaming
+): Promise<Anthropic.Message> {
+  // SDK retries are disabled here; requestMessage handles them with backoff
+  const stream = client.messages.stream(params, { maxRetries: 0, timeout: REQUEST_TIMEOUT_MS })
+
+  if (DEBUG) {
+    stream.on('contentBlock', (block) => {
+      if (block.type === 'tool_use') {
+        debugLog(`[Getter] Received ${block.name} tool call`)
+      } else {
+        debugLog(`[Getter] Received ${block.type} block`)
+      }
+    })
+  }
+
+  return stream.finalMessage()
+}
+
 /**
  * Extract items array from Claude response
- * Handles web_search responses which have multiple text blocks interspersed with search results
+ * Prefers the emit_items tool call, whose input is already parsed JSON
+ * Falls back to scanning text blocks for a JSON code block
  */
 function extractItemsFromResponse<T>(response: Anthropic.Message): T[] {
-  // Log all content blocks for debugging
-  console.log('[Getter] Response content blocks:', response.content.length)
-  for (const block of response.content) {
-    console.log(`[Getter]   - ${block.type}`)
+  if (DEBUG) {
+    debugLog('[Getter] Response content blocks:', response.content.length)
+    for (const block of response.content) {
+      debugLog(`[Getter]   - ${block.type}`)
+    }
+  }
+
+  const emitBlock = response.content.find(
+    (block): block is Anthropic.ToolUseBlock =>
+      block.type === 'tool_use' && block.name === EMIT_ITEMS_TOOL_NAME
+  )
+  const emitted = (emitBlock?.input as { items?: unknown } | undefined)?.items
+  if (Array.isArray(emitted)) {
+    console.log(`[Getter] Extracted ${emitted.length} items from ${EMIT_ITEMS_TOOL_NAME} tool call`)
+    return emitted as T[]
   }
 
   // Get ALL text blocks (web_search responses have multiple)
@@ -110,12 +745,12 @@ function extractItemsFromResponse<T>(response: Anthropic.Message): T[] {
     return []
   }
 
-  console.log(`[Getter] Found ${textBlocks.length} text blocks`)
+  debugLog(`[Getter] Found ${textBlocks.length} text blocks`)
 
   // Try each text block, starting from the LAST one (most likely to have final JSON)
   for (let i = textBlocks.length - 1; i >= 0; i--) {
     const text = textBlocks[i].text
-    console.log(`[Getter] Checking text block ${i + 1}/${textBlocks.length}, length: ${text.length}`)
+    debugLog(`[Getter] Checking text block ${i + 1}/${textBlocks.length}, length: ${text.length}`)
 
     // Try to extract JSON from this text block
     const items = tryExtractJson<T>(text)
@@ -127,7 +762,7 @@ function extractItemsFromResponse<T>(response: Anthropic.Message): T[] {
 
   // If individual blocks didn't work, try concatenating all text blocks
   const combinedText = textBlocks.map(b => b.text).join('\n\n')
-  console.log('[Getter] Trying combined text, total length:', combinedText.length)
+  debugLog('[Getter] Trying combined text, total length:', combinedText.length)
   const items = tryExtractJson<T>(combinedText)
   if (items.length > 0) {
     console.log(`[Getter] Successfully extracted ${items.length} items from combined text`)
@@ -143,42 +778,48 @@ function extractItemsFromResponse<T>(response: Anthropic.Message): T[] {
  * Try to extract JSON items from text
  */
 function tryExtractJson<T>(text: string): T[] {
-  // Try direct JSON parse first
-  try {
-    const parsed = JSON.parse(text)
-    if (Array.isArray(parsed)) return parsed
-    if (parsed.items && Array.isArray(parsed.items)) return parsed.items
-    return []
-  } catch {
-    // Try to find JSON in the text - multiple patterns
-    const patterns = [
-      // Markdown code block
-      /```json\s*([\s\S]*?)\s*```/,
-      /```\s*([\s\S]*?)\s*```/,
-      // Object with items array
-      /(\{[\s\S]*"items"\s*:\s*\[[\s\S]*\][\s\S]*\})/,
-      // Plain array of objects
-      /(\[\s*\{[\s\S]*\}\s*\])/
-    ]
+  // Try direct JSON parse first - only when the text can be bare JSON, since
+  // a throwing JSON.parse over a long prose block is the expensive path
+  if (startsLikeJson(text)) {
+    try {
+      const parsed = JSON.parse(text)
+      if (Array.isArray(parsed)) return parsed
+      if (parsed.items && Array.isArray(parsed.items)) return parsed.items
+      return []
+    } catch {
+      // Fall through to scanning
+    }
+  }
 
-    for (const pattern of patterns) {
-      const match = text.match(pattern)
-      if (match) {
-        try {
-          const json = match[1] || match[0]
-          const parsed = JSON.parse(json)
-          if (Array.isArray(parsed) && parsed.length > 0) return parsed
-          if (parsed.items && Array.isArray(parsed.items) && parsed.items.length > 0) return parsed.items
-        } catch {
-          // Try next pattern
-        }
+  // Scan the top-level JSON documents (inside code fences when present) with
+  // a bracket-balanced scanner; a document that fails to parse is repaired
+  // as a whole (trailing commas, truncation) rather than searched for nested
+  // values. Take the first items object or array of objects
+  for (const json of iterateJsonDocuments(text)) {
+    const parsed = parseJsonDocument(json)
+    if (!parsed) continue
+
+    const value = parsed.value
+    const items = Array.isArray(value) ? value : (value as { items?: unknown } | null)?.items
+    if (Array.isArray(items) && items.length > 0 && typeof items[0] === 'object') {
+      if (parsed.repaired) {
+        console.log(`[Getter] Recovered ${items.length} items from repaired JSON`)
       }
+      return items as T[]
     }
   }
 
   return []
 }
 
+/**
+ * Check whether the first non-whitespace character can open a JSON document
+ */
+function startsLikeJson(text: string): boolean {
+  const first = text.trimStart()[0]
+  return first === '{' || first === '['
+}
+
 /**
  * Get collection info from database
  */
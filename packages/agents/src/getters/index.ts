@@ -5,6 +5,7 @@
 
 // Types
 export type {
+  CollectionBatchOptions,
   CollectionGetterOptions,
   CollectionGetterResult,
   WebsiteCollectionInfo,
@@ -12,9 +13,10 @@ export type {
 } from './types'
 
 // Core
-export { getCollectionItems, getCollectionByType } from './base-getter'
-export { transformToStructuredOutputSchema, wrapSchemaForArrayOutput, validateStructuredOutputSchema } from './schema-transformer'
-export { buildCollectionPrompt } from './prompt-builder'
+export { getCollectionItems, getCollectionItemsBatch, getCollectionByType, buildCollectionRequest } from './base-getter'
+export { transformToStructuredOutputSchema, wrapSchemaForArrayOutput, validateStructuredOutputSchema, omitSchemaProperties, pickSchemaProperties } from './schema-transformer'
+export { getItemValidator, validateItems, type ItemValidationError } from './item-validator'
+export { buildCollectionPrompt, buildCollectionSystemPrompt, buildItemDetailPrompt } from './prompt-builder'
 
 // Collection-specific getters
 export {
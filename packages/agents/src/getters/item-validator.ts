@@ -0,0 +1,69 @@
+/**
+ * Item Validator
+ * Validates extracted items against the collection JSON Schema
+ * Validators are compiled once per collection schema and reused across calls
+ */
+
+import Ajv, { type ValidateFunction } from 'ajv'
+
+export interface ItemValidationError {
+  field: string
+  error: string
+}
+
+/**
+ * ISO 8601 formats used by the collection schemas (zod .datetime() / .date())
+ * Ajv has no built-in formats; without these they were ignored with a warning
+ */
+const ISO_DATE = /^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$/
+const ISO_DATE_TIME = /^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])T([01]\d|2[0-3]):[0-5]\d(:[0-5]\d(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?$/
+
+const ajv = new Ajv({ allErrors: true, strict: false })
+ajv.addFormat('date', ISO_DATE)
+ajv.addFormat('date-time', ISO_DATE_TIME)
+
+const compiledValidators = new Map<string, { schemaJson: string; validate: ValidateFunction }>()
+
+/**
+ * Get the compiled validator for a collection, recompiling only if its schema changed
+ */
+export function getItemValidator(
+  collectionId: string,
+  schema: Record<string, unknown>
+): ValidateFunction {
+  const schemaJson = JSON.stringify(schema)
+  const compiled = compiledValidators.get(collectionId)
+  if (compiled && compiled.schemaJson === schemaJson) {
+    return compiled.validate
+  }
+
+  const validate = ajv.compile(schema)
+  compiledValidators.set(collectionId, { schemaJson, validate })
+  return validate
+}
+
+/**
+ * Split items into those that match the schema and the errors for those that don't
+ */
+export function validateItems<T>(
+  items: T[],
+  validate: ValidateFunction
+): { valid: T[]; errors: ItemValidationError[] } {
+  const valid: T[] = []
+  const errors: ItemValidationError[] = []
+
+  items.forEach((item, index) => {
+    if (validate(item)) {
+      valid.push(item)
+      return
+    }
+    for (const err of validate.errors || []) {
+      errors.push({
+        field: `item[${index}]${err.instancePath}`,
+        error: err.message || 'Validation failed'
+      })
+    }
+  })
+
+  return { valid, errors }
+}
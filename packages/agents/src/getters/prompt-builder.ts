@@ -6,7 +6,46 @@
 import type { CollectionGetterOptions, WebsiteCollectionInfo, ResearchConfigInfo } from './types'
 
 /**
- * Build the main collection research prompt
+ * Name of the tool the model calls to deliver its final items
+ */
+export const EMIT_ITEMS_TOOL_NAME = 'emit_items'
+
+/**
+ * Build the static system prompt for a collection
+ * Identical across calls for the same collection, so it is sent as a
+ * prompt-cached system block and only the user prompt varies per request
+ */
+export function buildCollectionSystemPrompt(collection: WebsiteCollectionInfo): string {
+  return `You research items for the "${collection.display_name}" collection.
+
+## Important Guidelines
+- Use web search to find current, accurate information
+- Only include items you're confident about
+- Every item should have verifiable information
+- Focus on quality over quantity
+- Return exactly the fields required by the schema
+- List items from most to least recommended; ranks are assigned from this order
+- Every item must match the item schema of the \`${EMIT_ITEMS_TOOL_NAME}\` tool
+
+## OUTPUT FORMAT (CRITICAL)
+After completing your research, you MUST call the \`${EMIT_ITEMS_TOOL_NAME}\` tool exactly once with all items.
+If you cannot call the tool, end your response with a valid JSON code block instead.
+The JSON must follow this exact format:
+
+\`\`\`json
+{
+  "items": [
+    { ... item 1 matching the schema ... },
+    { ... item 2 matching the schema ... }
+  ]
+}
+\`\`\`
+
+This JSON output is REQUIRED. Do not skip it.`
+}
+
+/**
+ * Build the per-request collection research prompt
  */
 export function buildCollectionPrompt(
   collection: WebsiteCollectionInfo,
@@ -50,28 +89,30 @@ ${options.promptAdditions}
 `
   }
 
-  prompt += `
-## Important Guidelines
-- Use web search to find current, accurate information
-- Only include items you're confident about
-- Every item should have verifiable information
-- Focus on quality over quantity
-- Return exactly the fields required by the schema
+  return prompt.trim()
+}
 
-## OUTPUT FORMAT (CRITICAL)
-After completing your research, you MUST end your response with a valid JSON code block.
-The JSON must follow this exact format:
+/**
+ * Build the prompt for researching the details of a single named item
+ */
+export function buildItemDetailPrompt(
+  collection: WebsiteCollectionInfo,
+  itemName: string,
+  options: CollectionGetterOptions
+): string {
+  let prompt = `You are a ${options.agentPersona}.
 
-\`\`\`json
-{
-  "items": [
-    { ... item 1 matching the schema ... },
-    { ... item 2 matching the schema ... }
-  ]
-}
-\`\`\`
+## Task
+Research "${itemName}" for the "${collection.display_name}" collection.
+Return exactly 1 item with complete, verified details.
+`
 
-This JSON output is REQUIRED. Do not skip it.`
+  if (options.promptAdditions) {
+    prompt += `
+## Additional Instructions
+${options.promptAdditions}
+`
+  }
 
   return prompt.trim()
 }
@@ -0,0 +1,139 @@
+/**
+ * Response Cache
+ * On-disk cache of Claude responses keyed by a hash of the request parameters.
+ * Entries are gzipped: responses carry web search results and shrink several-fold
+ */
+
+import { createHash } from 'crypto'
+import { readFile, stat } from 'fs/promises'
+import { join } from 'path'
+import { promisify } from 'util'
+import { gunzip, gzip } from 'zlib'
+import type Anthropic from '@anthropic-ai/sdk'
+import { ensureDir, writeFileAtomic } from '../base/fs'
+
+/**
+ * Cache location; SWARMPRESS_CACHE_DIR moves it, e.g. to share across checkouts
+ */
+export const CACHE_ROOT = join(process.env.SWARMPRESS_CACHE_DIR || join(process.cwd(), '.cache'), 'getters')
+
+/**
+ * Entry lifetime; SWARMPRESS_CACHE_TTL_SECONDS overrides the 24 hour default
+ */
+const DEFAULT_TTL_MS = getTtlSecondsFromEnv() * 1000
+
+/**
+ * Read SWARMPRESS_CACHE_TTL_SECONDS, falling back to 24 hours when it is unset
+ * or not a non-negative number (e.g. "1d"), which would otherwise never expire
+ */
+function getTtlSecondsFromEnv(): number {
+  const value = process.env.SWARMPRESS_CACHE_TTL_SECONDS
+  const seconds = value ? Number(value) : NaN
+  if (Number.isFinite(seconds) && seconds >= 0) return seconds
+
+  if (value) console.warn(`[Getter] Ignoring invalid SWARMPRESS_CACHE_TTL_SECONDS=${value}, using 24 hours`)
+  return 24 * 60 * 60
+}
+
+const gzipAsync = promisify(gzip)
+const gunzipAsync = promisify(gunzip)
+
+/**
+ * In-process L1 in front of the disk cache, so repeat requests within one run
+ * skip the file read and JSON.parse. Map order doubles as LRU order
+ */
+const MEMORY_CACHE_SIZE = 32
+const memoryCache = new Map<string, { storedAt: number; message: Anthropic.Message }>()
+
+/**
+ * Caching is on by default; set SWARMPRESS_CACHE=off to always hit the API
+ */
+export function isResponseCacheEnabled(): boolean {
+  return process.env.SWARMPRESS_CACHE !== 'off'
+}
+
+/**
+ * Build a deterministic cache key from request parameters (model, messages, tools, ...)
+ */
+export function getResponseCacheKey(params: object): string {
+  return createHash('sha256').update(stableStringify(params)).digest('hex')
+}
+
+/**
+ * Read a cached response, or null on miss / expiry
+ */
+export async function readCachedResponse(
+  namespace: string,
+  key: string,
+  ttlMs: number = DEFAULT_TTL_MS
+): Promise<Anthropic.Message | null> {
+  const memoryKey = `${namespace}/${key}`
+  const remembered = memoryCache.get(memoryKey)
+  if (remembered && Date.now() - remembered.storedAt <= ttlMs) {
+    // Re-insert to mark as most recently used
+    memoryCache.delete(memoryKey)
+    memoryCache.set(memoryKey, remembered)
+    // Callers post-process items in place, so hand out a copy
+    return structuredClone(remembered.message)
+  }
+
+  const file = getCacheFile(namespace, key)
+
+  try {
+    const { mtimeMs } = await stat(file)
+    if (Date.now() - mtimeMs > ttlMs) return null
+    const json = (await gunzipAsync(await readFile(file))).toString('utf-8')
+    const message = JSON.parse(json) as Anthropic.Message
+    rememberResponse(memoryKey, message, mtimeMs)
+    return structuredClone(message)
+  } catch {
+    // Missing or unreadable entry - treat as a miss, it will be overwritten
+    return null
+  }
+}
+
+/**
+ * Write a response to the cache
+ */
+export async function writeCachedResponse(
+  namespace: string,
+  key: string,
+  message: Anthropic.Message
+): Promise<void> {
+  // Serialize before the first await: callers may post-process the message's
+  // items while this write is still in flight
+  const json = JSON.stringify(message)
+  rememberResponse(`${namespace}/${key}`, JSON.parse(json) as Anthropic.Message, Date.now())
+
+  await ensureDir(join(CACHE_ROOT, namespace))
+  await writeFileAtomic(getCacheFile(namespace, key), await gzipAsync(json))
+}
+
+function rememberResponse(memoryKey: string, message: Anthropic.Message, storedAt: number): void {
+  memoryCache.delete(memoryKey)
+  memoryCache.set(memoryKey, { storedAt, message })
+  if (memoryCache.size > MEMORY_CACHE_SIZE) {
+    const oldest = memoryCache.keys().next().value
+    if (oldest !== undefined) memoryCache.delete(oldest)
+  }
+}
+
+function getCacheFile(namespace: string, key: string): string {
+  return join(CACHE_ROOT, namespace, `${key}.json.gz`)
+}
+
+/**
+ * JSON.stringify with sorted object keys so equal requests hash equally
+ */
+function stableStringify(value: unknown): string {
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(',')}]`
+  }
+  if (value && typeof value === 'object') {
+    const entries = Object.entries(value as Record<string, unknown>)
+      .filter(([, v]) => v !== undefined)
+      .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0))
+    return `{${entries.map(([k, v]) => `${JSON.stringify(k)}:${stableStringify(v)}`).join(',')}}`
+  }
+  return JSON.stringify(value)
+}
@@ -145,6 +145,34 @@ function removeUnsupportedKeywords(node: JsonSchema): void {
   }
 }
 
+/**
+ * Remove top-level properties from an object schema
+ * Used for fields filled in by code after extraction rather than by the model
+ */
+export function omitSchemaProperties(schema: JsonSchema, names: readonly string[]): JsonSchema {
+  if (!schema.properties || typeof schema.properties !== 'object') return schema
+
+  const properties = { ...(schema.properties as Record<string, JsonSchema>) }
+  for (const name of names) {
+    delete properties[name]
+  }
+
+  const result: JsonSchema = { ...schema, properties }
+  if (Array.isArray(schema.required)) {
+    result.required = (schema.required as string[]).filter(name => !names.includes(name))
+  }
+  return result
+}
+
+/**
+ * Keep only the given top-level properties of an object schema
+ */
+export function pickSchemaProperties(schema: JsonSchema, names: readonly string[]): JsonSchema {
+  const properties = (schema.properties || {}) as Record<string, JsonSchema>
+  const omitted = Object.keys(properties).filter(name => !names.includes(name))
+  return omitSchemaProperties(schema, omitted)
+}
+
 /**
  * Wrap a schema for array output
  * Creates the standard { items: [...] } wrapper
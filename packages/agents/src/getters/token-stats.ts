@@ -0,0 +1,67 @@
+/**
+ * Token Stats
+ * Rolling output-token history used to size max_tokens to what calls actually need
+ */
+
+import { readFile } from 'fs/promises'
+import { join } from 'path'
+import { ensureDir, writeFileAtomic } from '../base/fs'
+import { CACHE_ROOT } from './response-cache'
+
+const STATS_FILE = join(CACHE_ROOT, 'token-stats.json')
+const MAX_SAMPLES = 50
+const MIN_SAMPLES = 5
+const HEADROOM = 1.2
+
+let stats: Record<string, number[]> | null = null
+let pendingWrite: Promise<void> = Promise.resolve()
+
+/**
+ * Get max_tokens for a call: p95 of recent output tokens plus 20% headroom,
+ * capped at the ceiling. Returns the ceiling until enough samples exist
+ */
+export async function getAdaptiveMaxTokens(key: string, ceiling: number): Promise<number> {
+  const samples = (await loadStats())[key] || []
+  if (samples.length < MIN_SAMPLES) return ceiling
+
+  return Math.min(ceiling, Math.ceil(percentile(samples, 0.95) * HEADROOM))
+}
+
+/**
+ * Record the output tokens of a completed (non-truncated) call
+ */
+export async function recordOutputTokens(key: string, outputTokens: number): Promise<void> {
+  const all = await loadStats()
+  all[key] = [...(all[key] || []), outputTokens].slice(-MAX_SAMPLES)
+
+  // Chain writes so concurrent calls never race on the temp file
+  pendingWrite = pendingWrite.catch(() => {}).then(() => saveStats(all))
+  return pendingWrite
+}
+
+async function saveStats(all: Record<string, number[]>): Promise<void> {
+  await ensureDir(CACHE_ROOT)
+  await writeFileAtomic(STATS_FILE, JSON.stringify(all))
+}
+
+/**
+ * Load stats once per process; later reads and writes use the in-memory copy
+ */
+async function loadStats(): Promise<Record<string, number[]>> {
+  if (!stats) {
+    try {
+      stats = JSON.parse(await readFile(STATS_FILE, 'utf-8')) as Record<string, number[]>
+    } catch {
+      stats = {}
+    }
+  }
+  return stats
+}
+
+/**
+ * Nearest-rank percentile
+ */
+function percentile(samples: number[], p: number): number {
+  const sorted = [...samples].sort((a, b) => a - b)
+  return sorted[Math.min(sorted.length - 1, Math.ceil(p * sorted.length) - 1)] ?? 0
+}
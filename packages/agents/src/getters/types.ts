@@ -9,15 +9,32 @@ export interface CollectionGetterOptions {
   count?: number
   filters?: Record<string, unknown>
   promptAdditions?: string
+  // When set, list item names first, then fetch each item's details in
+  // parallel with at most this many requests in flight
+  detailConcurrency?: number
+  // Skip the response cache for this call and replace its entries with fresh data
+  forceRefresh?: boolean
+  // Maximum age of a cached response to reuse; defaults to SWARMPRESS_CACHE_TTL_SECONDS
+  cacheTtlMs?: number
+}
+
+export interface CollectionBatchOptions {
+  // How often to check whether a Message Batches submission has ended
+  pollIntervalMs?: number
+  // Give up waiting after this long (batches can take up to 24 hours)
+  maxWaitMs?: number
 }
 
 export interface CollectionGetterResult<T = Record<string, unknown>> {
   success: boolean
   items: T[]
   error?: string
+  validationErrors?: Array<{ field: string; error: string }>
   usage?: {
     inputTokens: number
     outputTokens: number
+    cacheReadInputTokens?: number
+    cacheCreationInputTokens?: number
   }
 }
 
@@ -4,6 +4,7 @@
  */
 
 import { ToolHandler, ToolResult, toolSuccess, toolError, ToolContext } from '../base/tools'
+import { getSharedAnthropicClient } from '../base/api-call'
 
 // Import core media handlers from writer (reuse the same implementations)
 import {
@@ -600,9 +601,7 @@ export const validateImageContentHandler: ToolHandler<ValidateImageContentInput>
       villageContext: input.villageContext,
     })
 
-    // Get Anthropic client
-    const Anthropic = (await import('@anthropic-ai/sdk')).default
-    const client = new Anthropic()
+    const client = getSharedAnthropicClient()
 
     const { validateImageContent } = await import('@swarm-press/shared')
     const result = await validateImageContent(
@@ -765,8 +764,7 @@ export const auditContentImagesHandler: ToolHandler<AuditContentImagesInput> = a
     // Get Anthropic client if we need vision validation
     let anthropicClient
     if (input.validateContent) {
-      const Anthropic = (await import('@anthropic-ai/sdk')).default
-      anthropicClient = new Anthropic()
+      anthropicClient = getSharedAnthropicClient()
     }
 
     const auditResult = await runContentAudit({
@@ -5,6 +5,10 @@
 
 import Anthropic from '@anthropic-ai/sdk';
 import { z } from 'zod';
+import { getSharedAnthropicClient } from '../../base/api-call';
+import { mapWithConcurrency } from '../../base/concurrency';
+import { iterateJsonDocuments, parseJsonDocument, repairJson } from '../../base/json-extract';
+import { withRetry } from '../../base/retry';
 
 // ============================================================================
 // Types
@@ -23,6 +27,19 @@ export interface ResearchResult<T> {
   rawResponse?: string;
 }
 
+/**
+ * Server-side web search tool, built once rather than per request
+ * (cast because web_search_20250305 is not in the current SDK types)
+ */
+const WEB_SEARCH_TOOLS = [
+  { type: 'web_search_20250305', name: 'web_search' },
+] as unknown as Anthropic.Tool[];
+
+/**
+ * Default number of research calls in flight at once, to stay within rate limits
+ */
+const DEFAULT_CONCURRENCY = 4;
+
 const DEFAULT_OPTIONS: ResearchOptions = {
   model: 'claude-sonnet-4-20250514',
   maxTokens: 32000,
@@ -45,26 +62,33 @@ export async function executeResearch<T>(
   const { model, maxTokens, temperature } = { ...DEFAULT_OPTIONS, ...options };
 
   try {
-    // Initialize Anthropic client
-    const client = new Anthropic();
+    const client = getSharedAnthropicClient();
 
     // Execute the search with web_search tool
-    const message = await client.messages.create({
-      model: model!,
-      max_tokens: maxTokens!,
-      temperature: temperature,
-      // @ts-expect-error - web_search tool type may not be in current SDK types
-      tools: [{ type: 'web_search' }],
-      messages: [{ role: 'user', content: prompt }],
-    });
+    // Streamed so a long generation (up to maxTokens) isn't one idle HTTP wait;
+    // transient failures (429/529/5xx/timeouts) are retried with backoff
+    const message = await withRetry(
+      () =>
+        client.messages
+          .stream(
+            {
+              model: model!,
+              max_tokens: maxTokens!,
+              temperature: temperature,
+              tools: WEB_SEARCH_TOOLS,
+              messages: [{ role: 'user', content: prompt }],
+            },
+            { maxRetries: 0 }
+          )
+          .finalMessage(),
+      { label: 'Research' }
+    );
 
     // Extract text content from response
-    let responseText = '';
-    for (const block of message.content) {
-      if (block.type === 'text') {
-        responseText += block.text;
-      }
-    }
+    const responseText = message.content
+      .filter((block): block is Anthropic.TextBlock => block.type === 'text')
+      .map((block) => block.text)
+      .join('');
 
     // Parse JSON from response
     const jsonData = extractJSON(responseText);
@@ -100,6 +124,22 @@ export async function executeResearch<T>(
   }
 }
 
+/**
+ * Execute several research queries (e.g. one per village) concurrently
+ * Calls overlap, so total time is roughly the slowest call rather than the sum.
+ * Results keep the order of the prompts
+ */
+export async function executeResearchAll<T>(
+  prompts: string[],
+  schema: z.ZodType<T>,
+  options: ResearchOptions = {},
+  concurrency: number = DEFAULT_CONCURRENCY
+): Promise<ResearchResult<T>[]> {
+  return mapWithConcurrency(prompts, concurrency, (prompt) =>
+    executeResearch(prompt, schema, options)
+  );
+}
+
 // ============================================================================
 // Helper Functions
 // ============================================================================
@@ -109,61 +149,46 @@ export async function executeResearch<T>(
  * Handles cases where JSON is wrapped in markdown code blocks or other text
  */
 export function extractJSON(text: string): unknown | null {
-  // First try to parse the entire text as JSON
-  try {
-    return JSON.parse(text.trim());
-  } catch {
-    // Continue to extraction methods
-  }
-
-  // Strip markdown code blocks
-  let cleaned = text
-    .replace(/```json\s*/gi, '')
-    .replace(/```\s*/g, '')
-    .trim();
-
-  // Try to parse cleaned text
-  try {
-    return JSON.parse(cleaned);
-  } catch {
-    // Continue to extraction methods
-  }
-
-  // Try to find JSON object in the text
-  const jsonStart = cleaned.indexOf('{');
-  const jsonEnd = cleaned.lastIndexOf('}');
-
-  if (jsonStart !== -1 && jsonEnd > jsonStart) {
-    const jsonStr = cleaned.substring(jsonStart, jsonEnd + 1);
+  // First try to parse the entire text as JSON (skipped for prose, where it can only throw)
+  const trimmed = text.trim();
+  if (trimmed.startsWith('{') || trimmed.startsWith('[')) {
     try {
-      return JSON.parse(jsonStr);
+      return JSON.parse(trimmed);
     } catch {
-      // Try cleaning up the JSON
-      const furtherCleaned = cleanJSON(jsonStr);
-      try {
-        return JSON.parse(furtherCleaned);
-      } catch {
-        return null;
-      }
+      // Continue to extraction methods
     }
   }
 
-  // Try to find JSON array
-  const arrayStart = cleaned.indexOf('[');
-  const arrayEnd = cleaned.lastIndexOf(']');
-
-  if (arrayStart !== -1 && arrayEnd > arrayStart) {
-    const jsonStr = cleaned.substring(arrayStart, arrayEnd + 1);
-    try {
-      return JSON.parse(jsonStr);
-    } catch {
-      return null;
-    }
+  // Walk the top-level JSON documents (inside code fences when present) with a
+  // bracket-balanced scanner, so braces in prose or inside strings can't
+  // produce a bad slice. A document that fails to parse is repaired as a whole
+  // (trailing commas, truncation, then loose quoting) - never searched for
+  // nested values, and a truncated document ends the scan, so its complete
+  // inner arrays can't be mistaken for the answer. Prefer the first object,
+  // as research prompts ask for one
+  let firstArray: unknown[] | null = null;
+  for (const json of iterateJsonDocuments(text)) {
+    const value = parseJsonDocument(json)?.value ?? parseLooseJson(json);
+    if (value === undefined) continue;
+    if (!Array.isArray(value)) return value;
+    firstArray ??= value;
   }
+  if (firstArray) return firstArray;
 
   return null;
 }
 
+/**
+ * Last-resort parse of a document with loose quoting / newlines
+ */
+function parseLooseJson(json: string): unknown {
+  try {
+    return JSON.parse(cleanJSON(repairJson(json) ?? json));
+  } catch {
+    return undefined;
+  }
+}
+
 /**
  * Clean up malformed JSON
  */
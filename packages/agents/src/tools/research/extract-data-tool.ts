@@ -3,10 +3,11 @@
  * Composable tool for extracting structured data from search results
  */
 
-import Anthropic from '@anthropic-ai/sdk'
-import Ajv from 'ajv'
 import { db } from '@swarm-press/backend'
-import { buildExtractionPrompt } from './prompt-builder'
+import { getItemValidator } from '../../getters/item-validator'
+import { getSharedAnthropicClient } from '../../base/api-call'
+import { withRetry } from '../../base/retry'
+import { buildExtractionPrompt, buildExtractionInstructions, buildExtractionInput } from './prompt-builder'
 import { extractCoreSchema, simplifySchemaForExtraction } from './schema-transformer'
 import type { ResearchToolContext, ExtractDataResult, WebsiteCollectionInfo, ResearchConfigInfo } from './types'
 
@@ -72,7 +73,18 @@ export async function extractDataHandler(
     const config = await getResearchConfig(collection.id)
 
     // 2. Build extraction prompt from schema + config
-    const extractionPrompt = buildExtractionPrompt(search_results, collection, config)
+    // The default prompt is split so its static instructions are prompt-cached
+    // across calls; custom templates embed the results inline and stay one block
+    const extractionContent = config?.extraction_prompt
+      ? [{ type: 'text' as const, text: buildExtractionPrompt(search_results, collection, config) }]
+      : [
+          {
+            type: 'text' as const,
+            text: buildExtractionInstructions(collection, config),
+            cache_control: { type: 'ephemeral' as const }
+          },
+          { type: 'text' as const, text: buildExtractionInput(search_results, collection) }
+        ]
 
     // 3. Prepare schema for structured outputs
     // Extract core schema from definitions pattern (common with zodToJsonSchema)
@@ -94,30 +106,30 @@ export async function extractDataHandler(
     }
 
     // 4. Call Claude with structured outputs for guaranteed schema compliance
-    const client = new Anthropic()
+    const client = getSharedAnthropicClient()
 
     console.log('[ExtractDataTool] Using structured outputs for extraction')
 
-    const message = await client.beta.messages.create({
-      model: 'claude-sonnet-4-5-20250929',
-      max_tokens: 32000,
-      temperature: 0,
-      betas: ['structured-outputs-2025-11-13'],
-      messages: [{ role: 'user', content: extractionPrompt }],
-      // @ts-expect-error - output_format is part of structured outputs beta
-      output_format: {
-        type: 'json_schema',
-        schema: outputSchema
-      }
-    })
+    const message = await withRetry(
+      () => client.beta.messages.create({
+        model: 'claude-sonnet-4-5-20250929',
+        max_tokens: 32000,
+        temperature: 0,
+        betas: ['structured-outputs-2025-11-13'],
+        messages: [{ role: 'user', content: extractionContent }],
+        // @ts-expect-error - output_format is part of structured outputs beta
+        output_format: {
+          type: 'json_schema',
+          schema: outputSchema
+        }
+      }, { maxRetries: 0 }),
+      { label: 'ExtractDataTool' }
+    )
 
     // 5. Extract text content from response - guaranteed to be valid JSON
-    let responseText = ''
-    for (const block of message.content) {
-      if (block.type === 'text') {
-        responseText += block.text
-      }
-    }
+    const responseText = message.content
+      .map(block => (block.type === 'text' ? block.text : ''))
+      .join('')
 
     // 6. Parse JSON - structured outputs guarantees valid JSON matching schema
     let jsonData: { items: unknown[] }
@@ -139,7 +151,7 @@ export async function extractDataHandler(
     const items = jsonData.items || []
 
     // 8. Validate each item against schema (backup validation - structured outputs should guarantee compliance)
-    const { valid, errors } = validateItems(items, collection.json_schema, config)
+    const { valid, errors } = validateItems(items, collection, config)
 
     return {
       success: true,
@@ -172,14 +184,15 @@ interface ValidationResult {
 
 /**
  * Validate extracted items against JSON Schema
+ * Uses the per-collection compiled validator shared with the getters, so the
+ * schema is compiled once rather than on every extraction call
  */
 function validateItems(
   items: unknown[],
-  schema: Record<string, unknown>,
+  collection: WebsiteCollectionInfo,
   config?: ResearchConfigInfo | null
 ): ValidationResult {
-  const ajv = new Ajv({ allErrors: true, strict: false })
-  const validate = ajv.compile(schema)
+  const validate = getItemValidator(collection.id, collection.json_schema)
 
   const valid: Record<string, unknown>[] = []
   const errors: Array<{ field: string; error: string }> = []
@@ -10,6 +10,8 @@
 // ============================================================================
 
 export {
+  executeResearch,
+  executeResearchAll,
   extractJSON,
   createSchemaPrompt,
   type ResearchOptions,
@@ -64,6 +66,8 @@ export { storeItemsTool, storeItemsHandler } from './store-items-tool'
 export {
   buildSearchPrompt,
   buildExtractionPrompt,
+  buildExtractionInstructions,
+  buildExtractionInput,
   buildValidationPrompt,
 } from './prompt-builder'
 
@@ -56,12 +56,26 @@ export function buildExtractionPrompt(
   if (config?.extraction_prompt) {
     return config.extraction_prompt
       .replace('{{search_results}}', searchResults)
-      .replace('{{schema}}', JSON.stringify(collection.json_schema, null, 2))
+      .replace('{{schema}}', JSON.stringify(collection.json_schema))
       .replace('{{field_hints}}', formatFieldHints(collection, config))
       .replace('{{collection_name}}', collection.display_name)
       .replace('{{singular_name}}', collection.singular_name || 'item')
   }
 
+  return `${buildExtractionInstructions(collection, config)}
+
+${buildExtractionInput(searchResults, collection)}`
+}
+
+/**
+ * Build the static part of the default extraction prompt
+ * Depends only on the collection and config, so it can be sent as a
+ * prompt-cached block ahead of the per-call search results
+ */
+export function buildExtractionInstructions(
+  collection: WebsiteCollectionInfo,
+  config?: ResearchConfigInfo | null
+): string {
   const fieldHints = formatFieldHints(collection, config)
 
   // Simplified prompt - structured outputs API handles schema compliance
@@ -79,9 +93,17 @@ ${fieldHints || 'Fill in all fields accurately based on the search results.'}
 - Use null for genuinely unknown values, not empty strings or placeholder text
 - Ensure accuracy - only extract data that is clearly stated in the results
 ${config?.require_source_urls ? '- Every item MUST have a source_url to be included' : ''}
-${config?.min_confidence_score ? `- Only include items where you are at least ${Math.round(config.min_confidence_score * 100)}% confident in the data accuracy` : ''}
+${config?.min_confidence_score ? `- Only include items where you are at least ${Math.round(config.min_confidence_score * 100)}% confident in the data accuracy` : ''}`
+}
 
-## Search Results
+/**
+ * Build the per-call part of the default extraction prompt
+ */
+export function buildExtractionInput(
+  searchResults: string,
+  collection: WebsiteCollectionInfo
+): string {
+  return `## Search Results
 ${searchResults}
 
 Extract all valid ${collection.singular_name || 'items'} now.`
@@ -132,11 +154,11 @@ export function buildValidationPrompt(
 
 ## Items to Validate
 \`\`\`json
-${JSON.stringify(items, null, 2)}
+${JSON.stringify(items)}
 \`\`\`
 
 ## Schema Requirements
-${JSON.stringify(collection.json_schema, null, 2)}
+${JSON.stringify(collection.json_schema)}
 
 ## Validation Rules
 - Check all required fields are present and non-null
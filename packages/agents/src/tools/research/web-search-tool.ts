@@ -4,8 +4,9 @@
  * Uses Anthropic's web_search_20250305 tool type
  */
 
-import Anthropic from '@anthropic-ai/sdk'
 import { db } from '@swarm-press/backend'
+import { getSharedAnthropicClient } from '../../base/api-call'
+import { withRetry } from '../../base/retry'
 import { buildSearchPrompt } from './prompt-builder'
 import type { ResearchToolContext, WebSearchResult, WebsiteCollectionInfo, ResearchConfigInfo } from './types'
 
@@ -122,23 +123,27 @@ export async function webSearchHandler(
     const webSearchConfig = buildWebSearchToolConfig(config, max_results)
 
     // 4. Execute web search via Claude API with web_search_20250305
-    const client = new Anthropic()
-
-    const message = await client.messages.create({
-      model: 'claude-sonnet-4-20250514',
-      max_tokens: 16000,
-      temperature: 0,
-      tools: [webSearchConfig as any], // web_search_20250305 tool
-      messages: [{ role: 'user', content: searchPrompt }]
-    })
+    const client = getSharedAnthropicClient()
+
+    // Streamed so the up-to-16k-token answer isn't one idle HTTP wait
+    const message = await withRetry(
+      () => client.messages.stream({
+        model: 'claude-sonnet-4-20250514',
+        max_tokens: 16000,
+        temperature: 0,
+        tools: [webSearchConfig as any], // web_search_20250305 tool
+        messages: [{ role: 'user', content: searchPrompt }]
+      }, { maxRetries: 0 }).finalMessage(),
+      { label: 'WebSearchTool' }
+    )
 
     // 5. Extract text content and sources from response
-    let responseText = ''
+    const textParts: string[] = []
     const sources: string[] = []
 
     for (const block of message.content) {
       if (block.type === 'text') {
-        responseText += block.text + '\n'
+        textParts.push(block.text)
       }
       // Handle web_search tool results
       // The response includes server_tool_use blocks with web_search results
@@ -169,7 +174,7 @@ export async function webSearchHandler(
 
     return {
       success: true,
-      results: responseText.trim(),
+      results: textParts.join('\n').trim(),
       collection_type,
       query,
       sources
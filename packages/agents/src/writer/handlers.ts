@@ -4,6 +4,7 @@
  */
 
 import { ToolHandler, ToolResult, toolSuccess, toolError } from '../base/tools'
+import { getSharedAnthropicClient } from '../base/api-call'
 import { validateContentBlocks } from '../base/utilities'
 import {
   getAgentForPageType,
@@ -963,8 +964,7 @@ export const generateTranslationHandler: ToolHandler<{
     })
 
     // Use Claude for translation
-    const Anthropic = (await import('@anthropic-ai/sdk')).default
-    const client = new Anthropic()
+    const client = getSharedAnthropicClient()
 
     const languageNames: Record<string, string> = {
       de: 'German',
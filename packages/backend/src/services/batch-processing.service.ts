@@ -323,6 +323,36 @@ Output the JSON now:`
 // BATCH PROCESSING SERVICE
 // =============================================================================
 
+/**
+ * Find the end (exclusive) of the JSON object opening at start, or -1 if unclosed
+ * Skips string contents so braces inside values (e.g. descriptions) don't count
+ */
+function findJsonObjectEnd(text: string, start: number): number {
+  let depth = 0
+  let inString = false
+  let escape = false
+
+  for (let i = start; i < text.length; i++) {
+    const char = text[i]
+
+    if (inString) {
+      if (escape) escape = false
+      else if (char === '\\') escape = true
+      else if (char === '"') inString = false
+      continue
+    }
+
+    if (char === '"') inString = true
+    else if (char === '{') depth++
+    else if (char === '}') {
+      depth--
+      if (depth === 0) return i + 1
+    }
+  }
+
+  return -1
+}
+
 export class BatchProcessingService {
   private anthropic: Anthropic
 
@@ -598,19 +628,7 @@ export class BatchProcessingService {
     // Look for opening brace and find matching closing brace
     const jsonStart = fullText.indexOf('{')
     if (jsonStart !== -1) {
-      // Find the matching closing brace by counting braces
-      let depth = 0
-      let jsonEnd = -1
-      for (let i = jsonStart; i < fullText.length; i++) {
-        if (fullText[i] === '{') depth++
-        else if (fullText[i] === '}') {
-          depth--
-          if (depth === 0) {
-            jsonEnd = i + 1
-            break
-          }
-        }
-      }
+      const jsonEnd = findJsonObjectEnd(fullText, jsonStart)
       if (jsonEnd !== -1) {
         jsonText = fullText.substring(jsonStart, jsonEnd)
       }
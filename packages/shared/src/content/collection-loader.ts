@@ -326,9 +326,9 @@ function matchesFilter(
 }
 
 /**
- * Extract a string value from data, handling multilingual fields
+ * Extract a string value from data by dotted path, handling multilingual fields
  */
-function extractStringValue(data: Record<string, unknown>, fieldPath: string): string | undefined {
+export function extractStringValue(data: Record<string, unknown>, fieldPath: string): string | undefined {
   const value = getNestedValue(data, fieldPath)
 
   if (typeof value === 'string') return value
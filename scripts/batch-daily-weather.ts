@@ -18,6 +18,7 @@ import { writeFileSync, readFileSync, mkdirSync, existsSync } from 'fs'
 dotenv.config({ path: resolve(__dirname, '../.env') })
 
 import Anthropic from '@anthropic-ai/sdk'
+import { writeFileAtomic } from '../packages/agents/src/base/fs'
 
 const BATCH_OUTPUT_DIR = resolve(__dirname, '../.batch-output/daily-weather')
 const BATCH_ID_FILE = resolve(BATCH_OUTPUT_DIR, 'batch-id.txt')
@@ -347,7 +348,7 @@ async function processResults(): Promise<void> {
       items: days
     }
 
-    writeFileSync(filePath, JSON.stringify(monthData, null, 2))
+    await writeFileAtomic(filePath, JSON.stringify(monthData, null, 2))
     console.log(`  ✓ Saved: ${filename} (${days.length} days)`)
   }
 
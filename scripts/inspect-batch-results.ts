@@ -9,6 +9,7 @@ import { writeFileSync, mkdirSync, existsSync } from 'fs'
 dotenv.config({ path: resolve(__dirname, '../.env') })
 
 import Anthropic from '@anthropic-ai/sdk'
+import { extractBalancedJson } from '../packages/agents/src/base/json-extract'
 
 const batchId = process.argv[2] || 'msgbatch_016417GjdTM1iEsDpr8J6f5j'
 
@@ -17,22 +18,8 @@ function extractJsonFromText(text: string): string | null {
   const jsonStart = text.indexOf('{')
   if (jsonStart === -1) return null
 
-  // Find matching closing brace
-  let depth = 0
-  let jsonEnd = -1
-  for (let i = jsonStart; i < text.length; i++) {
-    if (text[i] === '{') depth++
-    else if (text[i] === '}') {
-      depth--
-      if (depth === 0) {
-        jsonEnd = i + 1
-        break
-      }
-    }
-  }
-
-  if (jsonEnd === -1) return null
-  return text.substring(jsonStart, jsonEnd)
+  // Find matching closing brace, ignoring braces inside strings
+  return extractBalancedJson(text, jsonStart)
 }
 
 async function main() {
@@ -13,6 +13,7 @@ import { writeFileSync, mkdirSync, existsSync } from 'fs'
 dotenv.config({ path: resolve(__dirname, '../.env') })
 
 import Anthropic from '@anthropic-ai/sdk'
+import { writeFileAtomic } from '../packages/agents/src/base/fs'
 
 // All batch IDs from the latest submissions
 const BATCH_IDS = {
@@ -384,7 +385,7 @@ async function processBatch(batchId: string, collectionName: string): Promise<vo
     // Save to file
     const filename = `${village}.json`
     const filePath = resolve(outputDir, filename)
-    writeFileSync(filePath, JSON.stringify(parsed, null, 2))
+    await writeFileAtomic(filePath, JSON.stringify(parsed, null, 2))
     console.log(`    Saved: ${collectionName}/${filename}`)
   }
 
@@ -1,6 +1,12 @@
 /**
  * Test Collection Getters
  * Verify the simplified ONE API call approach works
+ *
+ * Usage:
+ *   npx tsx scripts/test-getters.ts [collectionType[,collectionType...]] [count] [--no-cache] [--dry-run]
+ *
+ * Several comma-separated collection types are fetched concurrently.
+ * --dry-run builds and prints each request without calling the API
  */
 
 import { config } from 'dotenv'
@@ -8,16 +14,27 @@ config()
 
 // Direct source imports for development
 import { db } from '../packages/backend/src'
-import { getCollectionByType } from '../packages/agents/src/getters'
+import { buildCollectionRequest, getCollectionByType, type CollectionGetterResult } from '../packages/agents/src/getters'
+
+const SEPARATOR = '='.repeat(60)
 
 async function main() {
-  const collectionType = process.argv[2] || 'cinqueterre_restaurants'
-  const count = parseInt(process.argv[3] || '5')
+  const args = process.argv.slice(2)
+  const positional = args.filter(arg => !arg.startsWith('--'))
+  const collectionTypes = (positional[0] || 'cinqueterre_restaurants').split(',')
+  const count = parseInt(positional[1] || '5')
+
+  // --no-cache: always call the API (same as SWARMPRESS_CACHE=off)
+  if (args.includes('--no-cache')) {
+    process.env.SWARMPRESS_CACHE = 'off'
+  }
 
-  console.log('='.repeat(60))
-  console.log(`Testing Collection Getter: ${collectionType}`)
-  console.log(`Target count: ${count}`)
-  console.log('='.repeat(60))
+  console.log([
+    SEPARATOR,
+    `Testing Collection Getter: ${collectionTypes.join(', ')}`,
+    `Target count: ${count}`,
+    SEPARATOR
+  ].join('\n'))
 
   // Get website ID for Cinque Terre
   const { rows: websites } = await db.query<{ id: string }>(
@@ -36,52 +53,120 @@ async function main() {
   const agentPersona = 'expert travel writer specializing in Italian coastal regions, with deep knowledge of Cinque Terre local culture, cuisine, and hidden gems'
 
   console.log(`\nAgent Persona: ${agentPersona.substring(0, 50)}...`)
-  console.log('\nFetching data...\n')
 
-  const startTime = Date.now()
+  // --dry-run: load collections, build prompts and compile validators, but spend no tokens
+  if (args.includes('--dry-run')) {
+    const lines: string[] = []
+    for (const collectionType of collectionTypes) {
+      const params = await buildCollectionRequest({ websiteId, collectionType, agentPersona, count })
+      lines.push(...formatDryRun(collectionType, params))
+    }
+    process.stdout.write(lines.join('\n') + '\n')
+    await db.end()
+    return
+  }
 
-  // Use the generic getter
-  const result = await getCollectionByType(
-    collectionType,
-    websiteId,
-    agentPersona,
-    count
+  console.log('\nFetching data...\n')
+
+  // Fetch all collection types concurrently; wall time is the slowest call
+  const results = await Promise.all(
+    collectionTypes.map(async (collectionType) => {
+      const startTime = Date.now()
+      const result = await getCollectionByType(
+        collectionType,
+        websiteId,
+        agentPersona,
+        count
+      )
+      return { collectionType, result, duration: ((Date.now() - startTime) / 1000).toFixed(1) }
+    })
   )
 
-  const duration = ((Date.now() - startTime) / 1000).toFixed(1)
+  // Build the summary first and write it in one call
+  const lines: string[] = []
+  for (const { collectionType, result, duration } of results) {
+    lines.push(...formatResult(collectionType, result, duration))
+  }
+  process.stdout.write(lines.join('\n') + '\n')
+
+  await db.end()
+  console.log('\nDone!')
+}
+
+/**
+ * Format the request summary for one collection in a dry run
+ */
+function formatDryRun(
+  collectionType: string,
+  params: Awaited<ReturnType<typeof buildCollectionRequest>>
+): string[] {
+  const lines: string[] = [SEPARATOR, `DRY RUN: ${collectionType}`, SEPARATOR]
+  if (!params) {
+    lines.push('Collection not found', '')
+    return lines
+  }
 
-  console.log('='.repeat(60))
-  console.log('RESULTS')
-  console.log('='.repeat(60))
+  const system = Array.isArray(params.system)
+    ? params.system.map(block => block.text).join('\n')
+    : params.system ?? ''
+  const prompt = params.messages.map(message => message.content).join('\n')
+
+  lines.push(
+    `Model: ${params.model}`,
+    `Max tokens: ${params.max_tokens}`,
+    `Tools: ${(params.tools ?? []).map(tool => tool.name).join(', ')}`,
+    `System prompt: ${system.length} chars`,
+    `User prompt: ${prompt.length} chars`,
+    '\nUser prompt:',
+    prompt,
+    ''
+  )
+  return lines
+}
 
-  console.log(`Success: ${result.success}`)
-  console.log(`Items returned: ${result.items.length}`)
-  console.log(`Duration: ${duration}s`)
+/**
+ * Format the summary lines for one collection result
+ */
+function formatResult(
+  collectionType: string,
+  result: CollectionGetterResult,
+  duration: string
+): string[] {
+  const lines: string[] = [
+    SEPARATOR,
+    `RESULTS: ${collectionType}`,
+    SEPARATOR,
+    `Success: ${result.success}`,
+    `Items returned: ${result.items.length}`,
+    `Duration: ${duration}s`
+  ]
 
   if (result.usage) {
-    console.log(`Input tokens: ${result.usage.inputTokens}`)
-    console.log(`Output tokens: ${result.usage.outputTokens}`)
+    lines.push(
+      `Input tokens: ${result.usage.inputTokens}`,
+      `Output tokens: ${result.usage.outputTokens}`,
+      `Cache read/write tokens: ${result.usage.cacheReadInputTokens ?? 0}/${result.usage.cacheCreationInputTokens ?? 0}`
+    )
   }
 
   if (result.error) {
-    console.log(`Error: ${result.error}`)
+    lines.push(`Error: ${result.error}`)
   }
 
   if (result.items.length > 0) {
-    console.log('\nFirst item:')
-    console.log(JSON.stringify(result.items[0], null, 2))
+    lines.push('\nFirst item:', JSON.stringify(result.items[0], null, 2))
 
     if (result.items.length > 1) {
-      console.log('\nItem names:')
+      lines.push('\nItem names:')
       result.items.forEach((item: any, i) => {
         const name = item.name || item.title || item.basic_information?.name || `Item ${i + 1}`
-        console.log(`  ${i + 1}. ${name}`)
+        lines.push(`  ${i + 1}. ${name}`)
       })
     }
   }
 
-  await db.end()
-  console.log('\nDone!')
+  lines.push('')
+  return lines
 }
 
 main().catch(err => {